@@ -2,6 +2,7 @@
 Module for implementing a bitcoin/lightning regtest network.
 """
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import importlib
 import importlib.util
 import logging
@@ -145,6 +146,10 @@ class Network(object):
             self.nodedata_folder, 'node_mapping.pickle')
         self.channel_mapping_path = os.path.join(
             self.nodedata_folder, 'channel_mapping.pickle')
+        # marker file, signals that the folder holds a complete snapshot
+        # which can be restored from
+        self.snapshot_marker_path = os.path.join(
+            self.nodedata_folder, '.snapshot_ready')
 
         # read in channel and node mappings
         if not from_scratch:
@@ -157,6 +162,16 @@ class Network(object):
         """
         logger.info("Running regtest network (from scratch: %s).",
                     self.from_scratch)
+
+        if self.from_scratch:
+            # invalidate any previous snapshot before rebuilding, such that
+            # a crash mid-rebuild cannot leave a stale marker next to
+            # partially cleared daemon data
+            try:
+                os.remove(self.snapshot_marker_path)
+            except FileNotFoundError:
+                pass
+
         # start bitcoind
         self.bitcoind.start(self.from_scratch)
 
@@ -289,12 +304,29 @@ class Network(object):
         for node_name, node_instance in self.ln_nodes.items():
             node_instance.print_rpc_command()
 
-    def nodes_start(self):
+    def nodes_start(self, parallel=True):
         """
         Starts all LN nodes.
-        """
-        for node_name, node_instance in self.ln_nodes.items():
-            node_instance.start(from_scratch=self.from_scratch)
+
+        The nodes are independent processes which block until their daemon
+        reports readiness, so by default they are started concurrently and
+        the startup phase takes the maximum instead of the sum of the
+        individual startup times.
+
+        :param parallel: bool:
+            start the nodes concurrently, set to False for serial startup
+        """
+        if parallel:
+            with ThreadPoolExecutor(
+                    max_workers=len(self.ln_nodes)) as executor:
+                # materialize the results, such that startup exceptions are
+                # raised here
+                list(executor.map(
+                    lambda node: node.start(from_scratch=self.from_scratch),
+                    self.ln_nodes.values()))
+        else:
+            for node_name, node_instance in self.ln_nodes.items():
+                node_instance.start(from_scratch=self.from_scratch)
 
     def nodes_stop(self):
         """
@@ -462,7 +494,7 @@ class Network(object):
         logger.debug(
             f"NET: channel mapping\n{pformat(self.channel_mapping, indent=4)}")
 
-    def assemble_graph(self):
+    def assemble_graph(self, parallel=True):
         """
         Gives a representation of the state of the LN network.
 
@@ -470,13 +502,32 @@ class Network(object):
         a local view of the network, therefore we need to ask each node
         about its open channels and gather the information.
 
+        The listchannels calls to the nodes are independent blocking RPCs,
+        so by default they are fired concurrently and the time spent is the
+        maximum instead of the sum of the round-trip times.
+
+        :param parallel: bool:
+            query the nodes concurrently, set to False for serial queries
         :return: dict
         """
         graph = {}
 
-        for node_name, node_instance in self.ln_nodes.items():
+        # collect the channel states of all nodes
+        if parallel:
+            with ThreadPoolExecutor(
+                    max_workers=len(self.ln_nodes)) as executor:
+                channel_infos = dict(zip(
+                    self.ln_nodes.keys(),
+                    executor.map(
+                        lambda node: node.listchannels(),
+                        self.ln_nodes.values())))
+        else:
+            channel_infos = {
+                node_name: node_instance.listchannels()
+                for node_name, node_instance in self.ln_nodes.items()}
+
+        for node_name, channel_info in channel_infos.items():
             edges = {}
-            channel_info = node_instance.listchannels()
             logger.debug(f"NET: channel info{channel_info}")
             for channel in channel_info:
                 edge = {
@@ -505,11 +556,31 @@ class Network(object):
         with open(self.channel_mapping_path, 'wb') as f:
             pickle.dump(
                 self.channel_mapping, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # the mappings are saved last in a from-scratch run, so their
+        # presence marks the snapshot as restorable
+        with open(self.snapshot_marker_path, 'w'):
+            pass
 
     def read_mappings(self):
         """
         Loads the node and channel mappings.
-        """
+
+        Raises FileNotFoundError, if the nodedata folder does not contain
+        the mappings of a previous from-scratch run.
+        """
+        if not (os.path.isfile(self.node_mapping_path) and
+                os.path.isfile(self.channel_mapping_path)):
+            raise FileNotFoundError(
+                'No network snapshot found in {}, '
+                'needs a from_scratch = True run first.'.format(
+                    self.nodedata_folder))
+        # snapshots created before the marker was introduced lack it, but
+        # are still restorable
+        if not os.path.isfile(self.snapshot_marker_path):
+            logger.warning(
+                'Restoring from %s without a .snapshot_ready marker, '
+                'the snapshot may stem from an incomplete run.',
+                self.nodedata_folder)
         with open(self.node_mapping_path, 'rb') as f:
             self.node_mapping = pickle.load(f)
             self.node_mapping_inverse = {
@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from functools import wraps
 import subprocess
 import shutil
+import sys
 import time
 import os
 import os.path
@@ -794,7 +795,9 @@ class LND(LightningDaemon):
         logger.info(
             "%s: setting node public key to %s",
             self.name, info['identity_pubkey'])
-        self.pubkey = info['identity_pubkey']
+        # intern, such that repeated equality checks on the mappings can
+        # short-circuit on object identity
+        self.pubkey = sys.intern(info['identity_pubkey'])
 
     def listchannels(self) -> List[ChannelState]:
         command = ['listchannels']
@@ -806,12 +809,12 @@ class LND(LightningDaemon):
                 capacity=c['capacity'],
                 channel_id=c['chan_id'],
                 commit_fee=c['commit_fee'],
-                funding_txid=funding_txid,
+                funding_txid=sys.intern(funding_txid),
                 initiator=c['initiator'],
                 local_balance=c['local_balance'],
                 outpoint=int(outpoint),
                 remote_balance=c['remote_balance'],
-                remote_pubkey=c['remote_pubkey'],
+                remote_pubkey=sys.intern(c['remote_pubkey']),
                 state='OPEN' if c['active'] else 'OPENING',
             ))
         return channel_states
@@ -1019,7 +1022,7 @@ class Electrum(LightningDaemon):
         logger.info(
             "%s: setting node public key to %s",
             self.name, node_pubkey)
-        self.pubkey = node_pubkey
+        self.pubkey = sys.intern(node_pubkey)
 
     def listchannels(self) -> List[ChannelState]:
         command = ['list_channels']
@@ -1040,13 +1043,13 @@ class Electrum(LightningDaemon):
                 capacity=c['local_balance'] + c['remote_balance'],
                 channel_id=chan_id,
                 commit_fee=0,  # TODO: expose commit fee in electrum
-                funding_txid=funding_txid,
+                funding_txid=sys.intern(funding_txid),
                 initiator=True,  # TODO: expose initiator in electrum
                 local_balance=c['local_balance'],
                 outpoint=int(outpoint),
                 state=c['state'],
                 remote_balance=c['remote_balance'],
-                remote_pubkey=c['remote_pubkey']
+                remote_pubkey=sys.intern(c['remote_pubkey'])
             ))
         return channel_states
 
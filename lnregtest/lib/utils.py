@@ -1,15 +1,48 @@
-import json
 import difflib
+import hashlib
+import json
+
+# orjson (de)serializes several times faster than the stdlib, but is an
+# optional dependency
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def format_dict(dictionary):
     """
-    Formats dicts with indentation.
+    Formats dicts with 2-space indentation.
 
     :param dictionary: dict
     :return: str
     """
-    return json.dumps(dictionary, indent=4)
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                dictionary,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        except TypeError:
+            # orjson rejects some values the stdlib accepts, e.g. ints
+            # beyond 64 bits
+            pass
+    return json.dumps(dictionary, indent=2)
+
+
+class LazyFormat(object):
+    """
+    Defers dict formatting in log statements until a record is emitted.
+
+    Wraps a dict such that logger.debug("%s", LazyFormat(dictionary)) only
+    pays the JSON serialization cost of :func:`format_dict` when the log
+    level is enabled.
+    """
+    def __init__(self, dictionary):
+        self.dictionary = dictionary
+
+    def __str__(self):
+        return format_dict(self.dictionary)
 
 
 def decode_byte_string_to_dict_or_str(out):
@@ -19,6 +52,8 @@ def decode_byte_string_to_dict_or_str(out):
     :return: dict
     """
     try:
+        if orjson is not None:
+            return orjson.loads(out)
         json_data = json.loads(out)
         return json_data
     except json.decoder.JSONDecodeError:
@@ -28,6 +63,72 @@ def decode_byte_string_to_dict_or_str(out):
             return out.decode().strip()
 
 
+def dict_equal_fast(dict1, dict2):
+    """
+    Compares two dicts for equality by hashing their canonical JSON form.
+
+    Cheaper than a pretty-printed serialization of both sides when only
+    a yes/no answer is needed. Raises TypeError for values which are not
+    JSON-serializable, like the diffing path of :func:`dict_comparison`.
+    :param dict1: dict
+    :param dict2: dict
+    :return: bool
+    """
+    if dict1 is dict2:
+        return True
+
+    # both sides have to be serialized by the same library, otherwise
+    # formatting differences would break the digest comparison
+    serialized = None
+    if orjson is not None:
+        try:
+            option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            serialized = (orjson.dumps(dict1, option=option),
+                          orjson.dumps(dict2, option=option))
+        except TypeError:
+            # orjson rejects some values the stdlib accepts, e.g. ints
+            # beyond 64 bits; the stdlib fallback re-raises for truly
+            # unserializable values
+            pass
+    if serialized is None:
+        serialized = (
+            json.dumps(dict1, sort_keys=True).encode(),
+            json.dumps(dict2, sort_keys=True).encode())
+
+    return (hashlib.blake2b(serialized[0]).digest() ==
+            hashlib.blake2b(serialized[1]).digest())
+
+
+def dict_fingerprint(dictionary, digest_size=16):
+    """
+    Computes a short fingerprint of a dict's canonical JSON form.
+
+    Fingerprints of equal dicts are equal, so equality assertions over
+    several dicts can be collapsed into one comparison of a few bytes.
+    Unlike :func:`dict_equal_fast`, the serializer is chosen per dict, so
+    only fingerprints of dicts of the same type should be compared.
+    Raises TypeError for values which are not JSON-serializable, like the
+    other comparison helpers.
+    :param dictionary: dict
+    :param digest_size: int: length of the digest in bytes
+    :return: bytes
+    """
+    serialized = None
+    if orjson is not None:
+        try:
+            serialized = orjson.dumps(
+                dictionary,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson rejects some values the stdlib accepts, e.g. ints
+            # beyond 64 bits; the stdlib fallback re-raises for truly
+            # unserializable values
+            pass
+    if serialized is None:
+        serialized = json.dumps(dictionary, sort_keys=True).encode()
+    return hashlib.blake2b(serialized, digest_size=digest_size).digest()
+
+
 def dict_comparison(dict1, dict2, show_diff=False):
     """
     Compares two dicts for equality by converting to key-sorted dicts.
@@ -38,6 +139,14 @@ def dict_comparison(dict1, dict2, show_diff=False):
     :param show_diff: bool
     :return: bool
     """
+    # identical objects are trivially equal, no need to serialize
+    if dict1 is dict2:
+        return True
+
+    # without a requested diff, the cheaper hash comparison suffices
+    if not show_diff:
+        return dict_equal_fast(dict1, dict2)
+
     dict1 = json.dumps(dict1, sort_keys=True, indent=4)
     dict2 = json.dumps(dict2, sort_keys=True, indent=4)
     are_equal = dict1 == dict2
@@ -22,6 +22,9 @@ setuptools.setup(
     packages=setuptools.find_packages(),
     install_requires=['wheel'],
     setup_requires=['wheel'],
+    extras_require={
+        'test': ['pytest', 'pytest-xdist'],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -0,0 +1,144 @@
+"""
+Shared pytest fixtures for the integration tests.
+
+Booting a regtest network (bitcoind plus several lightning daemons) is by
+far the most expensive part of the test suite, so the network fixtures
+hand out a cached network which stays up across consecutive tests that
+request the same configuration. All network definitions share fixed
+daemon ports (including bitcoind's RPC and ZMQ ports), so only one
+network can ever run per worker process: requesting a different
+configuration tears the running network down before the next one boots.
+
+Tests that mutate the on-disk state (e.g. the restart test) must not use
+these fixtures and have to construct their own network.
+
+For local development, setting LNREGTEST_REUSE=1 in the environment makes
+the fixtures persist their networks under test/test_data and restore them
+on the next run, which replaces the full chain and channel setup by a
+short daemon restart. CI keeps the hermetic from-scratch default.
+"""
+import compileall
+import copy
+import logging.config
+import os
+
+import pytest
+
+from lnregtest.lib.common import logger_config
+from lnregtest.lib.network import Network
+
+# configure logging exactly once per (worker) process; test modules just
+# fetch the root logger instead of re-attaching handlers at import time
+if not logging.getLogger().handlers:
+    logging.config.dictConfig(logger_config)
+    logging.getLogger().setLevel(logging.DEBUG)
+
+_REUSE = os.environ.get('LNREGTEST_REUSE') == '1'
+_test_dir = os.path.dirname(__file__)
+# under pytest-xdist each worker gets its own test_data subfolder, such that
+# concurrently reused networks do not restore into the same nodedata folder
+_test_data_dir = os.path.join(
+    _test_dir, 'test_data', os.environ.get('PYTEST_XDIST_WORKER', ''))
+
+
+def pytest_configure(config):
+    """
+    Pre-compiles the package once per session to warm the bytecode cache.
+
+    compileall skips files whose cached bytecode is up to date, so repeated
+    runs only pay a cheap mtime check per module.
+    """
+    package_dir = os.path.join(_test_dir, os.pardir, 'lnregtest')
+    compileall.compile_dir(package_dir, quiet=1)
+
+
+def _make_network(**kwargs):
+    """
+    Creates a Network for a fixture.
+
+    With LNREGTEST_REUSE=1, runtime data is kept in a test_data subfolder
+    per node_limit and the network is restored from there if a previous
+    run has left its mappings behind; otherwise it is built from scratch
+    into that folder, so the next run can reuse it.
+    """
+    if _REUSE:
+        folder = os.path.join(_test_data_dir, kwargs.get('node_limit', 'C'))
+        definition = kwargs.get(
+            'network_definition_location', 'star_ring')
+        kwargs['nodedata_folder'] = folder
+        kwargs['from_scratch'] = not os.path.isfile(
+            os.path.join(folder, definition, '.snapshot_ready'))
+    return Network(**kwargs)
+
+
+# the single network currently running in this process, keyed by its
+# configuration
+_running = {'key': None, 'net': None}
+
+
+def _shutdown_running_network():
+    if _running['net'] is not None:
+        _running['net'].cleanup()
+        _running.update(key=None, net=None)
+
+
+def _get_network(node_limit):
+    """
+    Returns a running star_ring network with the given node limit.
+
+    The network stays up between calls with the same node_limit; a call
+    with a different node_limit shuts the running network down first, as
+    two networks cannot coexist on the shared daemon ports.
+    """
+    key = ('star_ring', node_limit)
+    if _running['key'] != key:
+        _shutdown_running_network()
+        testnet = _make_network(
+            network_definition_location='star_ring', from_scratch=True,
+            node_limit=node_limit)
+        testnet.run_nocleanup()
+        _running.update(key=key, net=testnet)
+    return _running['net']
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _network_teardown():
+    """Shuts down the network which is still running at session end."""
+    yield
+    _shutdown_running_network()
+
+
+@pytest.fixture
+def star_ring_net_C():
+    """
+    star_ring network with nodes A, B, C, cached across consecutive tests.
+    """
+    return _get_network('C')
+
+
+@pytest.fixture
+def star_ring_net_H():
+    """
+    star_ring network with nodes A to H, cached across consecutive tests.
+    """
+    return _get_network('H')
+
+
+_networkinfo_cache = {}
+
+
+@pytest.fixture
+def master_networkinfo_H(star_ring_net_H):
+    """
+    Network view of the master node, fetched once per session.
+
+    The getnetworkinfo RPC returns the same data for the lifetime of the
+    network (as long as no channels are opened or closed), so tests share
+    one cached copy instead of repeating the round-trip to lnd. The result
+    is deep-copied at cache time, such that tests cannot mutate the shared
+    view.
+    """
+    if 'H' not in _networkinfo_cache:
+        _networkinfo_cache['H'] = copy.deepcopy(
+            star_ring_net_H.master_node.getnetworkinfo())
+    return _networkinfo_cache['H']
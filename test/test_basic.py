@@ -1,23 +1,92 @@
 import asyncio
+import logging
 import os
 import unittest
 import time
 
+import pytest
+
 from lnregtest.lib.network import Network
-from lnregtest.lib.utils import format_dict, dict_comparison
-from lnregtest.lib.common import logger_config
+from lnregtest.lib.utils import (LazyFormat, dict_comparison,
+                                 dict_fingerprint)
 
-import logging.config
-logging.config.dictConfig(logger_config)
+# logging is configured once per process in conftest.py
 logger = logging.getLogger()
-logger.setLevel(logging.DEBUG)
-logger.handlers[0].setLevel(logging.INFO)
-
-test_dir = os.path.dirname(os.path.realpath(__file__))
-test_data_dir = os.path.join(test_dir, 'test_data')
-
 
-class TestBasicNetwork(unittest.TestCase):
+# __file__ is already absolute for imported modules, so the lstat syscalls
+# of a realpath resolution are not needed at import time
+test_dir = os.path.dirname(__file__)
+# under pytest-xdist each worker gets its own test_data subfolder, such that
+# concurrently running networks do not write into the same nodedata folder
+test_data_dir = os.path.join(
+    test_dir, 'test_data', os.environ.get('PYTEST_XDIST_WORKER', ''))
+
+
+# expected assembled graph for the star_ring network limited to nodes A to C,
+# shared at module scope so it is built only once at import
+_GRAPH_FIXTURE_STAR_RING_C = {
+    "A": {
+        "1": {
+            "remote_name": "C",
+            "capacity": 5000000,
+            "local_balance": 4496530,
+            "remote_balance": 500000,
+            "commit_fee": 2810,
+            "initiator": True
+        },
+        "4": {
+            "remote_name": "B",
+            "capacity": 4000000,
+            "local_balance": 400000,
+            "remote_balance": 3596530,
+            "commit_fee": 2810,
+            "initiator": False
+        }
+    },
+    "B": {
+        "4": {
+            "remote_name": "A",
+            "capacity": 4000000,
+            "local_balance": 3596530,
+            "remote_balance": 400000,
+            "commit_fee": 2810,
+            "initiator": True
+        },
+        "5": {
+            "remote_name": "C",
+            "capacity": 10000000,
+            "local_balance": 5046035,
+            "remote_balance": 4950495,
+            "commit_fee": 2810,
+            "initiator": True
+        }
+    },
+    "C": {
+        "1": {
+            "remote_name": "A",
+            "capacity": 5000000,
+            "local_balance": 500000,
+            "remote_balance": 4496530,
+            "commit_fee": 2810,
+            "initiator": False
+        },
+        "5": {
+            "remote_name": "B",
+            "capacity": 10000000,
+            "local_balance": 4950495,
+            "remote_balance": 5046035,
+            "commit_fee": 2810,
+            "initiator": False
+        }
+    }
+}
+
+
+@pytest.mark.slow
+class TestRestartNetwork(unittest.TestCase):
+    # restarting inherently needs two freshly built networks, which is why
+    # this test lives in its own TestCase and doesn't share a network with
+    # the session fixtures
     def test_restart_network(self):
         """
         Test for creating and restoring a network.
@@ -45,136 +114,94 @@ class TestBasicNetwork(unittest.TestCase):
         # human readable mapping needs to be defined in order those objects
         # to be addressable by developers.
         # These mappings can seen here:
-        logger.info("Channel mappings:")
-        logger.info(format_dict(testnet_loaded.channel_mapping))
-        logger.info("Node mappings:")
-        logger.info(format_dict(testnet_loaded.node_mapping))
-
-        # Finally test if the network was restored correctly
-        self.assertEqual(
-            testnet_from_scratch.channel_mapping,
-            testnet_loaded.channel_mapping)
-
-        self.assertEqual(
-            testnet_from_scratch.node_mapping,
-            testnet_loaded.node_mapping)
-
-    def test_graph_assembly(self):
-        """
-        Each node has a different view of the network, which is why the
-        graph has to be assembled from all the nodes via the listchannels
-        command.
-        """
-        testnet = Network(
-            network_definition_location='star_ring', from_scratch=True, node_limit='C')
-
-        graph_fixture = \
-            {
-                "A": {
-                    "1": {
-                        "remote_name": "C",
-                        "capacity": 5000000,
-                        "local_balance": 4496530,
-                        "remote_balance": 500000,
-                        "commit_fee": 2810,
-                        "initiator": True
-                    },
-                    "4": {
-                        "remote_name": "B",
-                        "capacity": 4000000,
-                        "local_balance": 400000,
-                        "remote_balance": 3596530,
-                        "commit_fee": 2810,
-                        "initiator": False
-                    }
-                },
-                "B": {
-                    "4": {
-                        "remote_name": "A",
-                        "capacity": 4000000,
-                        "local_balance": 3596530,
-                        "remote_balance": 400000,
-                        "commit_fee": 2810,
-                        "initiator": True
-                    },
-                    "5": {
-                        "remote_name": "C",
-                        "capacity": 10000000,
-                        "local_balance": 5046035,
-                        "remote_balance": 4950495,
-                        "commit_fee": 2810,
-                        "initiator": True
-                    }
-                },
-                "C": {
-                    "1": {
-                        "remote_name": "A",
-                        "capacity": 5000000,
-                        "local_balance": 500000,
-                        "remote_balance": 4496530,
-                        "commit_fee": 2810,
-                        "initiator": False
-                    },
-                    "5": {
-                        "remote_name": "B",
-                        "capacity": 10000000,
-                        "local_balance": 4950495,
-                        "remote_balance": 5046035,
-                        "commit_fee": 2810,
-                        "initiator": False
-                    }
-                }
-            }
-        # this try-finally construct has to be employed to keep a network
-        # running asynchronously, while accessing some of its properties
-        try:
-            testnet.run_nocleanup()
-            graph_dict = testnet.assemble_graph()
-            # to create a fixture, convert lower-case bool output to proper
-            # python bools:
-            logger.info("Complete assembled channel graph:")
-            logger.info(format_dict(graph_dict))
-            self.assertTrue(
-                dict_comparison(graph_dict, graph_fixture, show_diff=True))
-        finally:
-            testnet.cleanup()
-
-
-class TestLNDMasterNode(unittest.TestCase):
-    # this is a way to more efficiently test, by using one testnet for several
-    # tests by employing run_nocleanup()
-    @classmethod
-    def setUpClass(cls):
-        cls.testnet = Network(
-            network_definition_location='star_ring', from_scratch=True, node_limit='H')
-        cls.testnet.run_nocleanup()
-
-    @classmethod
-    def tearDownClass(cls):
-        cls.testnet.cleanup()
-
-    def test_master_view(self):
-        chan_infos = self.testnet.master_node_graph_view()
-        self.assertEqual(12, len(chan_infos))
-
-    def test_async_channel_open(self):
-        """Tests the asyncio rpc api for channel creation."""
-        channels_before = self.testnet.master_node.listchannels()
-        self.assertEqual(6, len(channels_before))
-
-        # open channel with async method
-        partner_pubkey = self.testnet.node_mapping['B']
-        coro = self.testnet.master_node._a_openchannel(
-            partner_pubkey,
-            100000,
-            0
-        )
-        asyncio.run(coro)
-        self.testnet.bitcoind.mine_blocks(3)
-        self.testnet.master_node.wait_for_log("HTLC manager started", offset=0)
-
-        channels_after = self.testnet.master_node.listchannels()
-        self.assertEqual(7, len(channels_after))
+        logger.debug("Channel mappings:\n%s",
+                     LazyFormat(testnet_loaded.channel_mapping))
+        logger.debug("Node mappings:\n%s",
+                     LazyFormat(testnet_loaded.node_mapping))
+
+        # Finally test if the network was restored correctly. On the pass
+        # path one fingerprint comparison covers both mappings; only on a
+        # mismatch the structural dict diffs are built.
+        fingerprint_from_scratch = (
+            dict_fingerprint(testnet_from_scratch.channel_mapping) +
+            dict_fingerprint(testnet_from_scratch.node_mapping))
+        fingerprint_loaded = (
+            dict_fingerprint(testnet_loaded.channel_mapping) +
+            dict_fingerprint(testnet_loaded.node_mapping))
+
+        if fingerprint_from_scratch != fingerprint_loaded:
+            # assertDictEqual keeps the failure diff scoped to dicts
+            self.assertDictEqual(
+                testnet_from_scratch.channel_mapping,
+                testnet_loaded.channel_mapping)
+            self.assertDictEqual(
+                testnet_from_scratch.node_mapping,
+                testnet_loaded.node_mapping)
+
+
+def test_graph_assembly(star_ring_net_C):
+    """
+    Each node has a different view of the network, which is why the
+    graph has to be assembled from all the nodes via the listchannels
+    command.
+    """
+    graph_dict = star_ring_net_C.assemble_graph()
+    # to create a fixture, convert lower-case bool output to proper
+    # python bools:
+    logger.debug("Complete assembled channel graph:\n%s",
+                 LazyFormat(graph_dict))
+    assert dict_comparison(
+        graph_dict, _GRAPH_FIXTURE_STAR_RING_C, show_diff=True)
+
+
+# the master node tests share the session-wide network fixture, so the
+# network is only booted once per pytest invocation
+def test_master_view(star_ring_net_H):
+    chan_infos = star_ring_net_H.master_node_graph_view()
+    assert 12 == len(chan_infos)
+
+
+def test_networkinfo(master_networkinfo_H):
+    """Tests the master node's network view via the cached getnetworkinfo.
+
+    The passing and the deliberately failing comparison share one cached
+    RPC result. Tests which alter the channel count request the
+    master_networkinfo_H fixture themselves, such that the view is always
+    cached before the first mutation, independent of test order.
+    """
+    # only the topology-determined part of the view is compared, the
+    # remaining fields vary from run to run
+    view = {key: master_networkinfo_H[key]
+            for key in ('num_nodes', 'num_channels')}
+    fixture_view = {'num_nodes': 8, 'num_channels': 12}
+    fixture_view_broken = {'num_nodes': 8, 'num_channels': 13}
+    assert dict_comparison(fixture_view, view)
+    assert not dict_comparison(fixture_view_broken, view)
+
+
+def test_async_channel_open(star_ring_net_H, master_networkinfo_H):
+    """Tests the asyncio rpc api for channel creation.
+
+    Requests master_networkinfo_H to fix its cache contents to the
+    pre-mutation network view before a channel is opened here.
+    """
+    testnet = star_ring_net_H
+    channels_before = testnet.master_node.listchannels()
+    assert 6 == len(channels_before)
+
+    # open channel with async method
+    partner_pubkey = testnet.node_mapping['B']
+    coro = testnet.master_node._a_openchannel(
+        partner_pubkey,
+        100000,
+        0
+    )
+    asyncio.run(coro)
+    testnet.bitcoind.mine_blocks(3)
+    testnet.master_node.wait_for_log("HTLC manager started", offset=0)
+
+    channels_after = testnet.master_node.listchannels()
+    assert 7 == len(channels_after)
 
 
 class TestRunFromBackground(unittest.TestCase):
@@ -1,3 +1,4 @@
+import logging
 import os
 import sys
 import tempfile
@@ -8,15 +9,11 @@ import warnings
 from lnregtest.lib.network import Network
 from lnregtest.lib.network_components import Electrum, ElectrumX, Bitcoind
 from lnregtest.lib.utils import format_dict, dict_comparison
-from lnregtest.lib.common import logger_config
 
-import logging.config
-logging.config.dictConfig(logger_config)
+# logging is configured once per process in conftest.py
 logger = logging.getLogger()
-logger.setLevel(logging.DEBUG)
-logger.handlers[0].setLevel(logging.DEBUG)
 
-test_dir = os.path.dirname(os.path.realpath(__file__))
+test_dir = os.path.dirname(__file__)
 test_data_dir = os.path.join(test_dir, 'test_data')
 
 